@@ -3,25 +3,34 @@ FastAPI server that exposes MCP tools as REST API endpoints.
 This allows tools to be accessed via HTTP for UI integration.
 """
 from fastapi import FastAPI, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Dict, Any
+from pydantic import BaseModel, Field
+from enum import StrEnum
+from typing import Dict, Any, List
+import asyncio
 import os
+import orjson
 from logging_config import get_logger
 
 from tools.tools_api import (
-    get_app_deployment_configuration,
+    get_app_deployment_configuration_json,
     checkout_repository,
     build_application,
+    stream_build_application,
     verify_artifact,
     deploy_artifact,
     restart_application,
     stop_application,
     get_application_status,
+    get_application_statuses,
     get_recent_logs,
+    stream_recent_logs,
     get_all_services_status_on_server,
     get_server_health_summary
 )
+from config import APPLICATIONS
 from api_config import (
     API_TITLE,
     API_DESCRIPTION,
@@ -31,15 +40,24 @@ from api_config import (
     CORS_CREDENTIALS,
     CORS_METHODS,
     CORS_HEADERS,
+    API_TIMEOUT_KEEP_ALIVE,
+    API_LIMIT_CONCURRENCY,
+    API_BACKLOG,
+    API_LOOP,
+    API_HTTP,
 )
 
 logger = get_logger(__name__)
 
+# Allowed application names; FastAPI rejects anything else during request validation
+AppName = StrEnum("AppName", [(name, name) for name in APPLICATIONS])
+
 # Initialize FastAPI app
 app = FastAPI(
     title=API_TITLE,
     description=API_DESCRIPTION,
-    version=API_VERSION
+    version=API_VERSION,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware for UI integration
@@ -53,6 +71,10 @@ if ENABLE_CORS:
     )
 
 
+# The configuration response never changes at runtime, so it is serialized once at import
+_CONFIG_RESPONSE = orjson.dumps({"success": True, "data": orjson.Fragment(get_app_deployment_configuration_json())})
+
+
 # ========================
 # Health & Info Endpoints
 # ========================
@@ -67,24 +89,19 @@ async def health_check() -> Dict[str, str]:
 # Configuration Endpoints
 # ========================
 @app.get("/api/v1/configuration")
-async def get_deployment_configuration() -> Dict[str, Any]:
+async def get_deployment_configuration() -> Response:
     """
     Get application deployment configuration and available applications.
     """
-    try:
-        logger.info("Deployment configuration requested")
-        config = get_app_deployment_configuration()
-        return {"success": True, "data": config}
-    except Exception as e:
-        logger.error("Error fetching deployment configuration", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Deployment configuration requested")
+    return Response(content=_CONFIG_RESPONSE, media_type="application/json")
 
 
 # ========================
 # Repository Operations
 # ========================
 @app.post("/api/v1/repository/checkout/{application_name}")
-async def checkout_repo(application_name: str) -> Dict[str, Any]:
+async def checkout_repo(application_name: AppName) -> Dict[str, Any]:
     """
     Clone or update repository for the specified application.
 
@@ -92,12 +109,9 @@ async def checkout_repo(application_name: str) -> Dict[str, Any]:
         application_name: Name of the application
     """
     try:
-        logger.info(f"Repository checkout requested for {application_name}")
-        result = checkout_repository(application_name)
+        logger.info("Repository checkout requested for %s", application_name)
+        result = await run_in_threadpool(checkout_repository, application_name)
         return {"success": result.get("success"), "data": result}
-    except ValueError as e:
-        logger.warning(f"Invalid application: {application_name}")
-        raise HTTPException(status_code=400, detail=str(e))
     except Exception:
         logger.error("Error checking out repository", exc_info=True)
         raise HTTPException(status_code=500, detail="Error checking out repository")
@@ -107,7 +121,7 @@ async def checkout_repo(application_name: str) -> Dict[str, Any]:
 # Build Operations
 # ========================
 @app.post("/api/v1/build/application/{application_name}")
-async def build_app(application_name: str) -> Dict[str, Any]:
+async def build_app(application_name: AppName) -> Dict[str, Any]:
     """
     Build application using predefined build system.
 
@@ -115,19 +129,37 @@ async def build_app(application_name: str) -> Dict[str, Any]:
         application_name: Name of the application to build
     """
     try:
-        logger.info(f"Application build requested for {application_name}")
-        result = build_application(application_name)
+        logger.info("Application build requested for %s", application_name)
+        result = await run_in_threadpool(build_application, application_name)
         return {"success": result.get("success"), "data": result}
     except ValueError as e:
-        logger.warning(f"Invalid application: {application_name}")
+        logger.warning("Invalid build configuration: %s", application_name)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception:
         logger.error("Error building application", exc_info=True)
         raise HTTPException(status_code=500, detail="Error building application")
 
 
+@app.post("/api/v1/build/application/{application_name}/stream")
+async def stream_build_app(application_name: AppName) -> StreamingResponse:
+    """
+    Build application and stream its output as NDJSON while the build runs.
+    Each line is {"line": ...}; the last one is {"result": ...} or {"error": ...}.
+
+    Args:
+        application_name: Name of the application to build
+    """
+    logger.info("Streamed application build requested for %s", application_name)
+
+    async def ndjson():
+        async for item in stream_build_application(application_name):
+            yield orjson.dumps(item) + b"\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 @app.post("/api/v1/artifact/verify/{application_name}")
-async def verify_app_artifact(application_name: str) -> Dict[str, Any]:
+async def verify_app_artifact(application_name: AppName) -> Dict[str, Any]:
     """
     Verify build artifact exists and is non-empty.
 
@@ -135,12 +167,9 @@ async def verify_app_artifact(application_name: str) -> Dict[str, Any]:
         application_name: Name of the application
     """
     try:
-        logger.info(f"Artifact verification requested for {application_name}")
-        result = verify_artifact(application_name)
+        logger.info("Artifact verification requested for %s", application_name)
+        result = await run_in_threadpool(verify_artifact, application_name)
         return {"success": result.get("success"), "data": result}
-    except ValueError as e:
-        logger.warning(f"Invalid application: {application_name}")
-        raise HTTPException(status_code=400, detail=str(e))
     except Exception:
         logger.error("Error verifying artifact", exc_info=True)
         raise HTTPException(status_code=500, detail="Error verifying artifact")
@@ -150,7 +179,7 @@ async def verify_app_artifact(application_name: str) -> Dict[str, Any]:
 # Deployment Operations
 # ========================
 @app.post("/api/v1/deployment/deploy/{application_name}")
-async def deploy_app(application_name: str) -> Dict[str, Any]:
+async def deploy_app(application_name: AppName) -> Dict[str, Any]:
     """
     Deploy artifact to deployment directory with backup.
 
@@ -158,11 +187,11 @@ async def deploy_app(application_name: str) -> Dict[str, Any]:
         application_name: Name of the application to deploy
     """
     try:
-        logger.info(f"Deployment requested for {application_name}")
-        result = deploy_artifact(application_name)
+        logger.info("Deployment requested for %s", application_name)
+        result = await run_in_threadpool(deploy_artifact, application_name)
         return {"success": result.get("success"), "data": result}
     except ValueError as e:
-        logger.warning(f"Invalid application or artifact: {application_name}")
+        logger.warning("Artifact not available for deployment: %s", application_name)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception:
         logger.error("Error deploying artifact", exc_info=True)
@@ -170,7 +199,7 @@ async def deploy_app(application_name: str) -> Dict[str, Any]:
 
 
 @app.post("/api/v1/application/restart/{application_name}")
-async def restart_app(application_name: str) -> Dict[str, Any]:
+async def restart_app(application_name: AppName) -> Dict[str, Any]:
     """
     Restart systemd service for the application.
 
@@ -178,18 +207,19 @@ async def restart_app(application_name: str) -> Dict[str, Any]:
         application_name: Name of the application to restart
     """
     try:
-        logger.info(f"Application restart requested for {application_name}")
-        result = restart_application(application_name)
+        logger.info("Application restart requested for %s", application_name)
+        result = await run_in_threadpool(restart_application, application_name)
         return {"success": result.get("success"), "data": result}
     except ValueError as e:
-        logger.warning(f"Invalid application or service: {application_name}")
+        # The application's service_name is missing from ALLOWED_SERVICES
+        logger.warning("Invalid application or service: %s", application_name)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception:
         logger.error("Error restarting application", exc_info=True)
         raise HTTPException(status_code=500, detail="Error restarting application")
 
 @app.post("/api/v1/application/stop/{application_name}")
-async def stop_app(application_name: str) -> Dict[str, Any]:
+async def stop_app(application_name: AppName) -> Dict[str, Any]:
     """
     Stop systemd service for the application.
 
@@ -197,11 +227,12 @@ async def stop_app(application_name: str) -> Dict[str, Any]:
         application_name: Name of the application to stop
     """
     try:
-        logger.info(f"Application stop requested for {application_name}")
-        result = stop_application(application_name)
+        logger.info("Application stop requested for %s", application_name)
+        result = await run_in_threadpool(stop_application, application_name)
         return {"success": result.get("success"), "data": result}
     except ValueError as e:
-        logger.warning(f"Invalid application or service: {application_name}")
+        # The application's service_name is missing from ALLOWED_SERVICES
+        logger.warning("Invalid application or service: %s", application_name)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception:
         logger.error("Error stopping application", exc_info=True)
@@ -210,7 +241,7 @@ async def stop_app(application_name: str) -> Dict[str, Any]:
 # Status & Monitoring
 # ========================
 @app.get("/api/v1/application/status/{application_name}")
-async def get_app_status(application_name: str) -> Dict[str, Any]:
+async def get_app_status(application_name: AppName) -> Dict[str, Any]:
     """
     Get systemd service status for the application.
 
@@ -218,22 +249,47 @@ async def get_app_status(application_name: str) -> Dict[str, Any]:
         application_name: Name of the application
     """
     try:
-        logger.info(f"Application status requested for {application_name}")
-        result = get_application_status(application_name)
+        logger.info("Application status requested for %s", application_name)
+        result = await run_in_threadpool(get_application_status, application_name)
         return {"success": True, "data": result}
     except ValueError as e:
-        logger.warning(f"Invalid application: {application_name}")
+        # The application's service_name is missing from ALLOWED_SERVICES
+        logger.warning("Invalid application or service: %s", application_name)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception:
         logger.error("Error fetching application status", exc_info=True)
         raise HTTPException(status_code=500, detail="Error fetching application status")
 
 
+@app.get("/api/v1/application/status")
+async def get_app_statuses(
+    applications: List[AppName] = Query(..., min_length=1)
+) -> Dict[str, Any]:
+    """
+    Get systemd service status for several applications in one call.
+
+    Args:
+        applications: Names of the applications (repeat the query parameter)
+    """
+    try:
+        application_names = list(dict.fromkeys(applications))
+        logger.info("Application statuses requested for %s", ", ".join(application_names))
+        result = await run_in_threadpool(get_application_statuses, application_names)
+        return {"success": True, "data": result}
+    except ValueError as e:
+        # The application's service_name is missing from ALLOWED_SERVICES
+        logger.warning("Invalid application or service: %s", ", ".join(application_names))
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception:
+        logger.error("Error fetching application statuses", exc_info=True)
+        raise HTTPException(status_code=500, detail="Error fetching application statuses")
+
+
 @app.get("/api/v1/application/logs/{application_name}")
 async def get_app_logs(
-    application_name: str,
+    application_name: AppName,
     lines: int = Query(1000, ge=1, le=10000)
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     Fetch recent logs for the application service.
 
@@ -242,21 +298,42 @@ async def get_app_logs(
         lines: Number of log lines to retrieve (1-10000, default: 100)
     """
     try:
-        logger.info(f"Recent logs requested for {application_name} ({lines} lines)")
-        result = get_recent_logs(application_name, lines)
-        return {"success": True, "data": result}
+        logger.info("Recent logs requested for %s (%s lines)", application_name, lines)
+        result = await run_in_threadpool(get_recent_logs, application_name, lines)
+        return ORJSONResponse(content={"success": True, "data": result})
     except ValueError as e:
-        logger.warning(f"Invalid application: {application_name}")
+        # The application's service_name is missing from ALLOWED_SERVICES
+        logger.warning("Invalid application or service: %s", application_name)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception:
         logger.error("Error fetching application logs", exc_info=True)
         raise HTTPException(status_code=500, detail="Error fetching application logs")
 
+@app.get("/api/v1/application/logs/{application_name}/stream")
+async def stream_app_logs(
+    application_name: AppName,
+    lines: int = Query(1000, ge=1, le=10000),
+    follow: bool = Query(False)
+) -> StreamingResponse:
+    """
+    Stream recent logs for the application service as NDJSON (journalctl JSON output).
+
+    Args:
+        application_name: Name of the application
+        lines: Number of log lines to start from (1-10000, default: 1000)
+        follow: Keep the stream open and send new entries as they are logged
+    """
+    logger.info("Log stream requested for %s (%s lines, follow=%s)", application_name, lines, follow)
+    return StreamingResponse(
+        stream_recent_logs(application_name, lines, follow),
+        media_type="application/x-ndjson"
+    )
+
 @app.get("/api/v1/server/services/status")
 async def get_all_services_status() -> Dict[str, Any]:
     """List all systemd services on the server"""
     try:
-        result = get_all_services_status_on_server()
+        result = await run_in_threadpool(get_all_services_status_on_server)
         return {"success": True, "data": result}
     except Exception:
         logger.error("Error fetching running services", exc_info=True)
@@ -266,7 +343,7 @@ async def get_all_services_status() -> Dict[str, Any]:
 async def get_server_health_summary_api() -> Dict[str, Any]:
     """Fetch server health summary including CPU, memory, disk, load average"""
     try:
-        result = get_server_health_summary()
+        result = await run_in_threadpool(get_server_health_summary)
         return {"success": True, "data": result}
     except Exception:
         logger.error("Error fetching server health summary", exc_info=True)
@@ -275,111 +352,125 @@ async def get_server_health_summary_api() -> Dict[str, Any]:
 # ========================
 # Workflow Endpoints
 # ========================
-@app.post("/api/v1/deployment/workflow/full-deploy/{application_name}")
-async def full_deployment_workflow(application_name: str) -> Dict[str, Any]:
-    """
-    Execute full deployment workflow for an application.
-    Steps: checkout → build → verify → deploy → restart → status
+# Steps that must succeed, in order: (result key, log description, tool function)
+WORKFLOW_STEPS = (
+    ("checkout", "Checkout repository", checkout_repository),
+    ("build", "Build application", build_application),
+    ("verify", "Verify artifact", verify_artifact),
+    ("deploy", "Deploy artifact", deploy_artifact),
+    ("restart", "Restart application", restart_application),
+)
+# The final status step is not required to succeed
+WORKFLOW_STEP_COUNT = len(WORKFLOW_STEPS) + 1
 
-    Args:
-        application_name: Name of the application to deploy
+# Number of journal lines attached to the workflow result after restart
+WORKFLOW_LOG_LINES = 50
+
+# Constant part of every workflow result; copied per run
+_WORKFLOW_TEMPLATE = {"workflow": "full-deploy"}
+
+
+class BatchDeployRequest(BaseModel):
+    """Request body for the batch full-deploy workflow"""
+    applications: List[AppName] = Field(..., min_length=1)
+    max_concurrency: int = Field(1, ge=1)
+
+
+async def _run_full_deployment(application_name: str) -> Dict[str, Any]:
     """
-    try:
-        logger.info(f"Full deployment workflow started for {application_name}")
+    Run checkout → build → verify → deploy → restart → status for one application.
+    Stops at the first failing step and reports it in the workflow results.
+    Recent service logs are collected together with the final status.
+    """
+    logger.info("Full deployment workflow started for %s", application_name)
 
-        workflow_results = {
-            "application": application_name,
-            "workflow": "full-deploy",
-            "steps": {}
-        }
+    steps: Dict[str, Any] = {}
+    workflow_results = _WORKFLOW_TEMPLATE.copy()
+    workflow_results["application"] = application_name
+    workflow_results["steps"] = steps
 
-        # Step 1: Checkout
+    # Steps 1-5: each must succeed before the next one runs
+    for step_number, (step, description, step_fn) in enumerate(WORKFLOW_STEPS, start=1):
         try:
-            logger.info("Workflow step 1/6: Checkout repository")
-            workflow_results["steps"]["checkout"] = checkout_repository(application_name)
-            if not workflow_results["steps"]["checkout"].get("success"):
+            logger.info("Workflow step %s/%s: %s", step_number, WORKFLOW_STEP_COUNT, description)
+            result = await run_in_threadpool(step_fn, application_name)
+            steps[step] = result
+            if not result.get("success"):
                 workflow_results["status"] = "failed"
-                workflow_results["failed_step"] = "checkout"
+                workflow_results["failed_step"] = step
                 return {"success": False, "data": workflow_results}
         except Exception as e:
-            logger.error("Workflow step 1 failed: checkout", exc_info=True)
-            workflow_results["steps"]["checkout"] = {"error": str(e)}
+            logger.error("Workflow step %s failed: %s", step_number, step, exc_info=True)
+            steps[step] = {"error": str(e)}
             workflow_results["status"] = "failed"
-            workflow_results["failed_step"] = "checkout"
+            workflow_results["failed_step"] = step
             return {"success": False, "data": workflow_results}
 
-        # Step 2: Build
-        try:
-            logger.info("Workflow step 2/6: Build application")
-            workflow_results["steps"]["build"] = build_application(application_name)
-            if not workflow_results["steps"]["build"].get("success"):
-                workflow_results["status"] = "failed"
-                workflow_results["failed_step"] = "build"
-                return {"success": False, "data": workflow_results}
-        except Exception as e:
-            logger.error("Workflow step 2 failed: build", exc_info=True)
-            workflow_results["steps"]["build"] = {"error": str(e)}
-            workflow_results["status"] = "failed"
-            workflow_results["failed_step"] = "build"
-            return {"success": False, "data": workflow_results}
+    # Step 6: Status, with recent logs fetched alongside it
+    logger.info("Workflow step %s/%s: Get application status and recent logs", WORKFLOW_STEP_COUNT, WORKFLOW_STEP_COUNT)
+    status_task = asyncio.create_task(run_in_threadpool(get_application_status, application_name))
+    logs_task = asyncio.create_task(
+        run_in_threadpool(get_recent_logs, application_name, WORKFLOW_LOG_LINES)
+    )
+    status_result, logs_result = await asyncio.gather(status_task, logs_task, return_exceptions=True)
 
-        # Step 3: Verify
-        try:
-            logger.info("Workflow step 3/6: Verify artifact")
-            workflow_results["steps"]["verify"] = verify_artifact(application_name)
-            if not workflow_results["steps"]["verify"].get("success"):
-                workflow_results["status"] = "failed"
-                workflow_results["failed_step"] = "verify"
-                return {"success": False, "data": workflow_results}
-        except Exception as e:
-            logger.error("Workflow step 3 failed: verify", exc_info=True)
-            workflow_results["steps"]["verify"] = {"error": str(e)}
-            workflow_results["status"] = "failed"
-            workflow_results["failed_step"] = "verify"
-            return {"success": False, "data": workflow_results}
+    if isinstance(status_result, Exception):
+        logger.error("Workflow step %s failed: status", WORKFLOW_STEP_COUNT, exc_info=status_result)
+        status_result = {"error": str(status_result)}
+    steps["status"] = status_result
 
-        # Step 4: Deploy
-        try:
-            logger.info("Workflow step 4/6: Deploy artifact")
-            workflow_results["steps"]["deploy"] = deploy_artifact(application_name)
-            if not workflow_results["steps"]["deploy"].get("success"):
-                workflow_results["status"] = "failed"
-                workflow_results["failed_step"] = "deploy"
-                return {"success": False, "data": workflow_results}
-        except Exception as e:
-            logger.error("Workflow step 4 failed: deploy", exc_info=True)
-            workflow_results["steps"]["deploy"] = {"error": str(e)}
-            workflow_results["status"] = "failed"
-            workflow_results["failed_step"] = "deploy"
-            return {"success": False, "data": workflow_results}
+    if isinstance(logs_result, Exception):
+        logger.error("Workflow step %s failed: logs", WORKFLOW_STEP_COUNT, exc_info=logs_result)
+        logs_result = {"error": str(logs_result)}
+    steps["logs"] = logs_result
 
-        # Step 5: Restart
-        try:
-            logger.info("Workflow step 5/6: Restart application")
-            workflow_results["steps"]["restart"] = restart_application(application_name)
-            if not workflow_results["steps"]["restart"].get("success"):
-                workflow_results["status"] = "failed"
-                workflow_results["failed_step"] = "restart"
-                return {"success": False, "data": workflow_results}
-        except Exception as e:
-            logger.error("Workflow step 5 failed: restart", exc_info=True)
-            workflow_results["steps"]["restart"] = {"error": str(e)}
-            workflow_results["status"] = "failed"
-            workflow_results["failed_step"] = "restart"
-            return {"success": False, "data": workflow_results}
+    workflow_results["status"] = "completed"
+    logger.info("Full deployment workflow completed successfully for %s", application_name)
+    return {"success": True, "data": workflow_results}
 
-        # Step 6: Status
-        try:
-            logger.info("Workflow step 6/6: Get application status")
-            workflow_results["steps"]["status"] = get_application_status(application_name)
-        except Exception as e:
-            logger.error("Workflow step 6 failed: status", exc_info=True)
-            workflow_results["steps"]["status"] = {"error": str(e)}
 
-        workflow_results["status"] = "completed"
-        logger.info(f"Full deployment workflow completed successfully for {application_name}")
-        return {"success": True, "data": workflow_results}
+@app.post("/api/v1/deployment/workflow/full-deploy/batch")
+async def batch_full_deployment_workflow(request: BatchDeployRequest) -> Dict[str, Any]:
+    """
+    Execute the full deployment workflow for several applications.
+    Workflows run concurrently, at most max_concurrency at a time (default: 1).
+
+    Args:
+        request: Applications to deploy and the concurrency limit
+    """
+    applications = list(dict.fromkeys(request.applications))
+    logger.info(
+        "Batch deployment workflow started for %s (max_concurrency=%s)",
+        ", ".join(applications), request.max_concurrency
+    )
+    semaphore = asyncio.Semaphore(request.max_concurrency)
+
+    async def run_one(application_name: AppName) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                return await _run_full_deployment(application_name)
+            except Exception as e:
+                logger.error("Unexpected error in deployment workflow for %s", application_name, exc_info=True)
+                return {"success": False, "error": str(e)}
+
+    results = await asyncio.gather(*[run_one(name) for name in applications])
+    batch_results = dict(zip(applications, results))
+    success = all(result["success"] for result in results)
+    logger.info("Batch deployment workflow finished (success=%s)", success)
+    return {"success": success, "data": batch_results}
+
+
+@app.post("/api/v1/deployment/workflow/full-deploy/{application_name}")
+async def full_deployment_workflow(application_name: AppName) -> Dict[str, Any]:
+    """
+    Execute full deployment workflow for an application.
+    Steps: checkout → build → verify → deploy → restart → status
 
+    Args:
+        application_name: Name of the application to deploy
+    """
+    try:
+        return await _run_full_deployment(application_name)
     except Exception:
         logger.error("Unexpected error in deployment workflow", exc_info=True)
         raise HTTPException(status_code=500, detail="Unexpected error in deployment workflow")
@@ -404,12 +495,17 @@ if __name__ == "__main__":
 
     api_port = int(os.getenv("API_PORT", 8002))
     api_host = os.getenv("API_HOST", "127.0.0.1")
-    logger.info(f"Starting FastAPI server on {api_host}:{api_port}")
+    logger.info("Starting FastAPI server on %s:%s", api_host, api_port)
 
     uvicorn.run(
         app,
         host=api_host,
         port=api_port,
+        timeout_keep_alive=API_TIMEOUT_KEEP_ALIVE,
+        limit_concurrency=API_LIMIT_CONCURRENCY,
+        backlog=API_BACKLOG,
+        loop=API_LOOP,
+        http=API_HTTP,
         log_config=None  # Use our custom logging
     )
 
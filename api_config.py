@@ -9,12 +9,26 @@ from pathlib import Path
 API_HOST = os.getenv("API_HOST", "127.0.0.1")  # Listen only on localhost for nginx
 API_PORT = int(os.getenv("API_PORT", 8002))
 API_RELOAD = os.getenv("API_RELOAD", "false").lower() == "true"
+API_TIMEOUT_KEEP_ALIVE = int(os.getenv("API_TIMEOUT_KEEP_ALIVE", 75))  # Seconds; outlives nginx's default upstream keepalive
+API_LIMIT_CONCURRENCY = int(os.getenv("API_LIMIT_CONCURRENCY", 256))
+API_BACKLOG = int(os.getenv("API_BACKLOG", 2048))
+API_LOOP = os.getenv("API_LOOP", "uvloop")
+API_HTTP = os.getenv("API_HTTP", "httptools")
+
+
+def _env_list(name, default="*"):
+    """Read a comma-separated env var; a bare wildcard becomes ["*"] so CORSMiddleware takes its allow-all path."""
+    raw = os.getenv(name, default).strip()
+    if raw == "*":
+        return ["*"]
+    return [item.strip() for item in raw.split(",") if item.strip()]
+
 
 # CORS Settings
-CORS_ORIGINS = os.getenv("CORS_ORIGINS", "*").split(",")
+CORS_ORIGINS = _env_list("CORS_ORIGINS")
 CORS_CREDENTIALS = os.getenv("CORS_CREDENTIALS", "true").lower() == "true"
-CORS_METHODS = os.getenv("CORS_METHODS", "*").split(",")
-CORS_HEADERS = os.getenv("CORS_HEADERS", "*").split(",")
+CORS_METHODS = _env_list("CORS_METHODS")
+CORS_HEADERS = _env_list("CORS_HEADERS")
 
 # Request/Response Settings
 MAX_LINES_LIMIT = int(os.getenv("MAX_LINES_LIMIT", 10000))
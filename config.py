@@ -1,39 +1,55 @@
+from dataclasses import dataclass
 from pathlib import Path
 
 BASE_REPO_DIR = Path("/opt/repos")
 BASE_DEPLOY_DIR = Path("/opt/app")
 
-APPLICATIONS = {
-    "famvest": {
-        "git_url": "git@github.com/ysonawan/famvest.git",
-        "branch": "main",
-        "build_type": "maven",
-        "artifact_path": "target/famvest-*.jar",
-        "service_name": "famvest-app",
-        "deploy_path": BASE_DEPLOY_DIR / "famvest",
-        "symlink": "famvest.jar",
-        "application_url": "https://famvest.online"
-    },
-    "netly": {
-        "git_url": "git@github.com/ysonawan/netly.git",
-        "branch": "main",
-        "build_type": "maven",
-        "artifact_path": "target/netly-*.jar",
-        "service_name": "netly-app",
-        "deploy_path": BASE_DEPLOY_DIR / "netly",
-        "symlink": "netly.jar",
-        "application_url": "https://netly.famvest.online"
-    },
-    "duebook": {
-        "git_url": "git@github.com/ysonawan/duebook.git",
-        "branch": "main",
-        "build_type": "maven",
-        "artifact_path": "target/duebook-*.jar",
-        "service_name": "duebook-app",
-        "deploy_path": BASE_DEPLOY_DIR / "duebook",
-        "symlink": "duebook.jar",
-        "application_url": "https://duebook.famvest.online"
-    }
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class AppSpec:
+    """Deployment settings for a single application."""
+    git_url: str
+    branch: str = "main"
+    build_type: str = "maven"
+    artifact_path: str
+    service_name: str
+    deploy_path: Path
+    symlink: str | None = None
+    application_url: str | None = None
+    shallow_clone: bool = True  # Only the branch tip is needed to build; set False to keep full history
+
+
+APPLICATIONS: dict[str, AppSpec] = {
+    "famvest": AppSpec(
+        git_url="git@github.com/ysonawan/famvest.git",
+        branch="main",
+        build_type="maven",
+        artifact_path="target/famvest-*.jar",
+        service_name="famvest-app",
+        deploy_path=BASE_DEPLOY_DIR / "famvest",
+        symlink="famvest.jar",
+        application_url="https://famvest.online"
+    ),
+    "netly": AppSpec(
+        git_url="git@github.com/ysonawan/netly.git",
+        branch="main",
+        build_type="maven",
+        artifact_path="target/netly-*.jar",
+        service_name="netly-app",
+        deploy_path=BASE_DEPLOY_DIR / "netly",
+        symlink="netly.jar",
+        application_url="https://netly.famvest.online"
+    ),
+    "duebook": AppSpec(
+        git_url="git@github.com/ysonawan/duebook.git",
+        branch="main",
+        build_type="maven",
+        artifact_path="target/duebook-*.jar",
+        service_name="duebook-app",
+        deploy_path=BASE_DEPLOY_DIR / "duebook",
+        symlink="duebook.jar",
+        application_url="https://duebook.famvest.online"
+    )
 }
 
 ALLOWED_SERVICES = {"famvest-app", "netly-app", "duebook-app"}
@@ -3,15 +3,22 @@ Production-grade logging configuration with log rotation.
 Provides structured logging with JSON output and console output.
 """
 
+import atexit
+import copy
+from contextlib import contextmanager
+from functools import lru_cache
 import logging
 import logging.config
+import queue
 import sys
+import threading
+import traceback
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
-import json
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import os
-from datetime import datetime, timezone
+import time
 
+import orjson
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -27,6 +34,17 @@ MAX_BYTES = int(os.getenv("MCP_LOG_MAX_BYTES", 10 * 1024 * 1024))  # 10 MB
 BACKUP_COUNT = int(os.getenv("MCP_LOG_BACKUP_COUNT", 10))  # Keep 10 backup files
 LOG_FORMAT = os.getenv("MCP_LOG_FORMAT", "detailed")  # detailed or json
 
+# How often a waiting rollover re-checks whether its handler was closed
+ROLLOVER_LOCK_POLL_SECONDS = 0.1
+
+# Background listener that writes queued records to the real handlers
+_queue_listener = None
+
+
+def _format_utc_timestamp(record):
+    """Format the record creation time as ISO 8601 UTC with millisecond precision."""
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(record.created))}.{int(record.msecs):03d}Z"
+
 
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging."""
@@ -34,7 +52,7 @@ class JSONFormatter(logging.Formatter):
     def format(self, record):
         """Format log record as JSON."""
         log_obj = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _format_utc_timestamp(record),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -51,32 +69,84 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, "extra_fields"):
             log_obj.update(record.extra_fields)
 
-        return json.dumps(log_obj)
+        return orjson.dumps(log_obj, default=str).decode("utf-8")
+
+
+class DeferredFormatQueueHandler(QueueHandler):
+    """
+    Queue handler that only enqueues records.
+    Formatting is left to the listener thread so the caller never touches the formatters.
+    """
+
+    def prepare(self, record):
+        """Merge message args and keep exc_info so the real formatter can render it."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class BackgroundRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that performs rollover on a background thread.
+    Emitting threads only compare the file size; renames and re-opens happen off the logging path.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize handler and start the rollover thread."""
+        super().__init__(*args, **kwargs)
+        self._rollover_pending = False
+        self._closed = False
+        self._rollover_requests = queue.SimpleQueue()
+        self._rollover_thread = threading.Thread(
+            target=self._rollover_worker,
+            name=f"log-rollover-{Path(self.baseFilename).name}",
+            daemon=True,
+        )
+        self._rollover_thread.start()
+
+    def shouldRollover(self, record):
+        """Schedule a rollover when the size limit is crossed, but never roll over inline."""
+        if not self._rollover_pending and super().shouldRollover(record):
+            self._rollover_pending = True
+            self._rollover_requests.put(True)
+        return False
+
+    def _rollover_worker(self):
+        """Perform scheduled rollovers under the handler lock."""
+        while self._rollover_requests.get():
+            # close() may be waiting for this thread while its caller holds the handler lock
+            # (logging.shutdown does), so never block on the lock once the handler is closed
+            while not self.lock.acquire(timeout=ROLLOVER_LOCK_POLL_SECONDS):
+                if self._closed:
+                    return
+            try:
+                # A rollover queued before close() must not rename files or reopen the stream
+                if not self._closed:
+                    self.doRollover()
+            except Exception:
+                if logging.raiseExceptions:
+                    traceback.print_exc(file=sys.stderr)
+            finally:
+                self._rollover_pending = False
+                self.release()
+
+    def close(self):
+        """Stop the rollover thread, wait for it to exit, then close the file."""
+        self._closed = True
+        self._rollover_requests.put(False)
+        self._rollover_thread.join()
+        super().close()
 
 
 class DetailedFormatter(logging.Formatter):
     """Custom detailed formatter for human-readable logs."""
 
     def __init__(self):
-        """Initialize formatter with default time format."""
-        super().__init__(datefmt="%Y-%m-%d %H:%M:%S")
-
-    def format(self, record):
-        """Format log record with detailed information."""
-        # Set asctime by calling parent's formatTime
-        record.asctime = self.formatTime(record, self.datefmt)
-
-        if record.exc_info:
-            return (
-                f"[{record.asctime}] {record.levelname:<8} "
-                f"[{record.name}:{record.funcName}:{record.lineno}] "
-                f"{record.getMessage()}\n"
-                f"{self.formatException(record.exc_info)}"
-            )
-        return (
-            f"[{record.asctime}] {record.levelname:<8} "
-            f"[{record.name}:{record.funcName}:{record.lineno}] "
-            f"{record.getMessage()}"
+        """Initialize formatter with the detailed format and default time format."""
+        super().__init__(
+            fmt="[%(asctime)s] %(levelname)-8s [%(name)s:%(funcName)s:%(lineno)d] %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
         )
 
 
@@ -85,6 +155,7 @@ def setup_logging():
     Configure logging with rotating file handlers and console output.
 
     Features:
+    - Records are enqueued by the caller and written by a background listener thread
     - Rotating file handler (size-based)
     - Timed rotating file handler (daily backup)
     - Console output for INFO+ messages
@@ -111,13 +182,20 @@ def setup_logging():
         ),
     }
 
+    # Write records from a background thread; callers only enqueue
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+    log_queue = queue.SimpleQueue()
+    _queue_listener = QueueListener(log_queue, *handlers.values(), respect_handler_level=True)
+    _queue_listener.start()
+    atexit.register(_queue_listener.stop)
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(LOG_LEVEL)
     root_logger.handlers.clear()  # Clear any existing handlers
-
-    for handler in handlers.values():
-        root_logger.addHandler(handler)
+    root_logger.addHandler(DeferredFormatQueueHandler(log_queue))
 
     # Set specific loggers
     logging.getLogger("fastmcp").setLevel(LOG_LEVEL)
@@ -139,8 +217,9 @@ def _create_file_handler(log_file, formatter):
     """
     Create rotating file handler.
     Rotates when file size exceeds MAX_BYTES, keeps BACKUP_COUNT backups.
+    Rollover runs on a background thread so it never stalls a logging call.
     """
-    handler = RotatingFileHandler(
+    handler = BackgroundRotatingFileHandler(
         log_file,
         maxBytes=MAX_BYTES,
         backupCount=BACKUP_COUNT,
@@ -156,7 +235,7 @@ def _create_error_file_handler(log_file, formatter):
     Create rotating file handler for errors only.
     Useful for quick access to errors without sifting through info logs.
     """
-    handler = RotatingFileHandler(
+    handler = BackgroundRotatingFileHandler(
         log_file,
         maxBytes=MAX_BYTES,
         backupCount=BACKUP_COUNT,
@@ -167,6 +246,7 @@ def _create_error_file_handler(log_file, formatter):
     return handler
 
 
+@lru_cache(maxsize=None)
 def get_logger(name):
     """
     Get a logger instance with the given name.
@@ -180,6 +260,7 @@ def get_logger(name):
     return logging.getLogger(name)
 
 
+@contextmanager
 def log_operation(logger, operation_name, operation_data=None):
     """
     Context manager to log operations with timing.
@@ -189,28 +270,21 @@ def log_operation(logger, operation_name, operation_data=None):
             # perform operation
             pass
     """
-    from contextlib import contextmanager
-    import time
-
-    @contextmanager
-    def _log_op():
-        start_time = time.time()
-        logger.info(f"Starting {operation_name}", extra={"extra_fields": operation_data or {}})
-        try:
-            yield
-            duration = time.time() - start_time
-            logger.info(
-                f"Completed {operation_name}",
-                extra={"extra_fields": {"duration_seconds": duration, **(operation_data or {})}},
-            )
-        except Exception as e:
-            duration = time.time() - start_time
-            logger.error(
-                f"Failed {operation_name}: {str(e)}",
-                exc_info=True,
-                extra={"extra_fields": {"duration_seconds": duration, **(operation_data or {})}},
-            )
-            raise
-
-    return _log_op()
-
+    operation_data = operation_data or {}
+    start_time = time.perf_counter()
+    logger.info(f"Starting {operation_name}", extra={"extra_fields": operation_data})
+    try:
+        yield
+    except Exception as e:
+        duration = time.perf_counter() - start_time
+        logger.error(
+            f"Failed {operation_name}: {str(e)}",
+            exc_info=True,
+            extra={"extra_fields": {"duration_seconds": duration, **operation_data}},
+        )
+        raise
+    duration = time.perf_counter() - start_time
+    logger.info(
+        f"Completed {operation_name}",
+        extra={"extra_fields": {"duration_seconds": duration, **operation_data}},
+    )
@@ -1,8 +1,8 @@
 import shutil
 import psutil
 
-from config import APPLICATIONS
 from logging_config import get_logger
+from tools.tools_api import get_app_deployment_configuration
 
 logger = get_logger(__name__)
 
@@ -25,4 +25,4 @@ def setup_resources(mcp):
     def deployment_config() -> dict:
         """Provides a application deployment configuration."""
         logger.debug("Retrieving deployment configuration")
-        return {"applications": APPLICATIONS}
+        return get_app_deployment_configuration()
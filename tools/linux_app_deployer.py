@@ -11,6 +11,7 @@ from tools.tools_api import (
     restart_application,
     stop_application,
     get_application_status,
+    get_application_statuses,
     get_recent_logs,
     get_all_services_status_on_server,
     get_server_health_summary
@@ -63,6 +64,11 @@ def setup_tools(mcp):
         """Get application status using systemd service status."""
         return get_application_status(application_name)
 
+    @mcp.tool()
+    def get_application_statuses_tool(application_names: list[str]) -> dict:
+        """Get status of several applications with a single systemd query."""
+        return get_application_statuses(application_names)
+
     @mcp.tool()
     def get_recent_logs_tool(application_name: str, lines: int = 100) -> dict:
         """Fetch recent logs safely."""
@@ -2,76 +2,487 @@
 Standalone tool implementations for API access.
 These are extracted from the MCP tools to allow direct function calls via the API.
 """
+import asyncio
+import fnmatch
+import os
 import subprocess
 import shutil
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+from typing import NamedTuple
+
+import orjson
+from cachetools import TTLCache
 from config import (
     BASE_REPO_DIR,
     APPLICATIONS,
     BUILD_COMMANDS,
-    ALLOWED_SERVICES
+    ALLOWED_SERVICES,
+    AppSpec
 )
 from logging_config import get_logger
 
+try:
+    from pystemd.dbuslib import DBus
+    from pystemd.systemd1 import Unit
+except ImportError:  # pystemd is optional; fall back to systemctl
+    DBus = None
+    Unit = None
+
+try:
+    from systemd import journal
+except ImportError:  # systemd-python is optional; fall back to journalctl
+    journal = None
+
 logger = get_logger(__name__)
 
 
+class _AppMeta(NamedTuple):
+    """Per-application values resolved once at import"""
+    config: AppSpec
+    service_name: str
+    repo_path: Path
+
+
+# Immutable allowlists and resolved per-application metadata
+_APP_SET = frozenset(APPLICATIONS)
+_SVC_SET = frozenset(ALLOWED_SERVICES)
+_APP_META = {
+    name: _AppMeta(spec, spec.service_name, BASE_REPO_DIR / name)
+    for name, spec in APPLICATIONS.items()
+}
+
+# Absolute paths for the fixed system commands, resolved once. With an absolute executable and
+# no cwd, subprocess launches via posix_spawn instead of fork+exec, which stays cheap as RSS grows.
+_BIN = {
+    name: shutil.which(name) or name
+    for name in ("systemctl", "journalctl", "uptime", "free", "df", "vmstat")
+}
+SYSTEMCTL = _BIN["systemctl"]
+JOURNALCTL = _BIN["journalctl"]
+
+# systemctl command lines for the allowlisted services, built once
+_RESTART_ARGV = {service: (SYSTEMCTL, "restart", service) for service in _SVC_SET}
+_STOP_ARGV = {service: (SYSTEMCTL, "stop", service) for service in _SVC_SET}
+
+# Command output kept in tool results (tail end, in characters)
+MAX_OUTPUT_CHARS = 4000
+
+# Streamed command output kept in tool results: first and last characters
+STREAM_OUTPUT_HEAD_CHARS = 10000
+STREAM_OUTPUT_TAIL_CHARS = 10000
+
+# Longest journal JSON line accepted when streaming logs (asyncio's default is 64 KiB)
+LOG_STREAM_LINE_LIMIT = 4 * 1024 * 1024
+
+# Unit properties reported by batch_status
+SYSTEMD_STATUS_PROPERTIES = ("LoadState", "ActiveState", "SubState", "MainPID")
+
+# systemd-coredump's "process dumped core" journal message
+COREDUMP_MESSAGE_ID = "fc2e22bc6ee647b6b90729ab34a250b1"
+
+# Short-lived caches for commonly polled lookups: service -> status, (service, lines) -> logs
+STATUS_CACHE_TTL = 1.0
+LOGS_CACHE_TTL = 1.5
+_status_cache = TTLCache(maxsize=128, ttl=STATUS_CACHE_TTL)
+_logs_cache = TTLCache(maxsize=128, ttl=LOGS_CACHE_TTL)
+# Bumped whenever a service is restarted or stopped; a query result is only cached if no
+# invalidation happened while it ran, so a mid-restart state can't outlive the restart
+_service_generation: dict[str, int] = {}
+_cache_lock = threading.Lock()
+
+# System bus connection per thread (sd-bus connections are not thread-safe); status lookups
+# run on worker threads, so each one opens its connection once and reuses it
+_dbus_local = threading.local()
+# The D-Bus fallback is logged with a traceback once, not on every status poll
+_dbus_failure_logged = False
+
+# Wildcard artifact lookups: application -> (cached_at, artifact dir mtime_ns, path, stat_result)
+ARTIFACT_CACHE_TTL = 3.0
+_artifact_cache: dict[str, tuple[float, int, Path, os.stat_result]] = {}
+
+# Server health summary: response key -> command
+HEALTH_SUMMARY_COMMANDS = {
+    "load_average": [_BIN["uptime"]],
+    "memory": [_BIN["free"], "-h"],
+    "disk": [_BIN["df"], "-h"],
+    "cpu": [_BIN["vmstat"], "1", "2"],
+}
+# Reused across calls so health summaries don't pay for thread start-up
+_HEALTH_EXECUTOR = ThreadPoolExecutor(max_workers=len(HEALTH_SUMMARY_COMMANDS), thread_name_prefix="health")
+
+
 # -------------------------
 # Utility helpers
 # -------------------------
+def _read_tail(output) -> str:
+    """Decode only the last MAX_OUTPUT_CHARS characters of a captured output file"""
+    output.seek(0, os.SEEK_END)
+    # UTF-8 uses at most 4 bytes per character
+    output.seek(max(0, output.tell() - MAX_OUTPUT_CHARS * 4))
+    return output.read().decode("utf-8", errors="replace")[-MAX_OUTPUT_CHARS:]
+
+
 def _run(cmd, cwd=None, timeout=600):
     """Execute a shell command and return results"""
+    # Output goes to temp files rather than pipes: memory stays flat for chatty builds and
+    # the child can never block on a full pipe
+    with tempfile.TemporaryFile() as stdout, tempfile.TemporaryFile() as stderr:
+        try:
+            p = subprocess.run(cmd, cwd=cwd, stdout=stdout, stderr=stderr, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            logger.warning("Command timed out after %s seconds: %s", timeout, " ".join(cmd))
+            return {"code": -1, "stdout": "", "stderr": f"Command timed out after {timeout} seconds"}
+        return {"code": p.returncode, "stdout": _read_tail(stdout), "stderr": _read_tail(stderr)}
+
+
+def _run_streaming(cmd, cwd=None, on_line=None, timeout=600):
+    """
+    Execute a command and pass each output line to on_line as it is produced.
+    stderr is merged into stdout; the returned output keeps the first and last
+    STREAM_OUTPUT_HEAD_CHARS / STREAM_OUTPUT_TAIL_CHARS characters.
+    """
+    proc = subprocess.Popen(
+        cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        text=True, bufsize=1, errors="replace"
+    )
+    timed_out = threading.Event()
+
+    def _kill_on_timeout():
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, _kill_on_timeout)
+    timer.start()
+    head, head_len = [], 0
+    tail, tail_len = deque(), 0
+    truncated = False
     try:
-        p = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, timeout=timeout)
-        return {"code": p.returncode, "stdout": p.stdout[-4000:], "stderr": p.stderr[-4000:]}
-    except subprocess.TimeoutExpired:
-        logger.warning(f"Command timed out after {timeout} seconds: {' '.join(cmd)}")
-        return {"code": -1, "stdout": "", "stderr": f"Command timed out after {timeout} seconds"}
+        for line in proc.stdout:
+            if on_line is not None:
+                on_line(line)
+            if head_len < STREAM_OUTPUT_HEAD_CHARS:
+                head.append(line)
+                head_len += len(line)
+                continue
+            tail.append(line)
+            tail_len += len(line)
+            while tail_len > STREAM_OUTPUT_TAIL_CHARS:
+                tail_len -= len(tail.popleft())
+                truncated = True
+        code = proc.wait()
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+
+    if timed_out.is_set():
+        logger.warning("Command timed out after %s seconds: %s", timeout, " ".join(cmd))
+        code = -1
+    output = "".join(head) + ("\n... [output truncated] ...\n" if truncated else "") + "".join(tail)
+    stderr = f"Command timed out after {timeout} seconds" if timed_out.is_set() else ""
+    return {"code": code, "stdout": output, "stderr": stderr}
 
 
 def require_application(application_name: str) -> None:
     """Validate that application is allowed"""
-    if application_name not in APPLICATIONS:
-        logger.warning(f"Attempted access to unauthorized application: {application_name}")
+    if application_name not in _APP_SET:
+        logger.warning("Attempted access to unauthorized application: %s", application_name)
         raise ValueError(f"Application '{application_name}' not allowed")
-    logger.debug(f"Application validation passed: {application_name}")
+    logger.debug("Application validation passed: %s", application_name)
 
 
 def require_service(service: str) -> None:
     """Validate that service is allowed"""
-    if service not in ALLOWED_SERVICES:
-        logger.warning(f"Attempted access to unauthorized service: {service}")
+    if service not in _SVC_SET:
+        logger.warning("Attempted access to unauthorized service: %s", service)
         raise ValueError(f"Service '{service}' not allowed")
-    logger.debug(f"Service validation passed: {service}")
+    logger.debug("Service validation passed: %s", service)
+
+
+def _unit_name(service: str) -> str:
+    """Full systemd unit name for a service"""
+    return service if service.endswith(".service") else f"{service}.service"
+
+
+def _system_bus():
+    """This thread's system bus connection, opened on first use"""
+    bus = getattr(_dbus_local, "bus", None)
+    if bus is None:
+        bus = DBus()
+        bus.open()
+        _dbus_local.bus = bus
+    return bus
+
+
+def _drop_system_bus() -> None:
+    """Close this thread's bus connection so the next lookup reconnects"""
+    bus = getattr(_dbus_local, "bus", None)
+    _dbus_local.bus = None
+    if bus is not None:
+        try:
+            bus.close()
+        except Exception:
+            pass
+
+
+def _dbus_status(service: str) -> dict:
+    """Read unit state from systemd over D-Bus (requires pystemd)"""
+    unit = Unit(_unit_name(service).encode(), bus=_system_bus())
+    unit.load()
+    return {
+        "LoadState": unit.Unit.LoadState.decode(),
+        "ActiveState": unit.Unit.ActiveState.decode(),
+        "SubState": unit.Unit.SubState.decode(),
+        "MainPID": int(unit.Service.MainPID),
+    }
+
+
+def _read_journal_tail(service: str, lines: int) -> dict:
+    """
+    Read the last `lines` journal entries for a service in-process (requires systemd-python).
+    Reads backwards and stops once MAX_OUTPUT_CHARS are collected, since only the tail is returned.
+    """
+    unit = _unit_name(service)
+    reader = journal.Reader()
+    try:
+        # Same matches as `journalctl -u`: the unit's own output, plus what systemd and
+        # systemd-coredump log about it ("Started ...", "Main process exited ...", core dumps)
+        reader.add_match(_SYSTEMD_UNIT=unit)
+        reader.add_disjunction()
+        reader.add_match(_PID="1", UNIT=unit)
+        reader.add_disjunction()
+        reader.add_match(_UID="0", OBJECT_SYSTEMD_UNIT=unit)
+        reader.add_disjunction()
+        reader.add_match(MESSAGE_ID=COREDUMP_MESSAGE_ID, _UID="0", COREDUMP_UNIT=unit)
+        reader.seek_tail()
+        entries = []
+        collected = 0
+        while len(entries) < lines and collected < MAX_OUTPUT_CHARS:
+            entry = reader.get_previous()
+            if not entry:
+                break
+            line = (
+                f"{entry['__REALTIME_TIMESTAMP']:%b %d %H:%M:%S} {entry.get('_HOSTNAME', '')} "
+                f"{entry.get('SYSLOG_IDENTIFIER', '')}[{entry.get('_PID', '')}]: {entry.get('MESSAGE', '')}"
+            )
+            entries.append(line)
+            collected += len(line) + 1
+    finally:
+        reader.close()
+
+    entries.reverse()
+    return {"code": 0, "stdout": "\n".join(entries)[-MAX_OUTPUT_CHARS:], "stderr": ""}
+
+
+def _query_status(services: list[str]) -> dict:
+    """Query systemd for unit state, over D-Bus when pystemd is installed, else with one `systemctl show`"""
+    if Unit is not None:
+        try:
+            return {service: _dbus_status(service) for service in services}
+        except Exception:
+            global _dbus_failure_logged
+            _drop_system_bus()
+            if not _dbus_failure_logged:
+                _dbus_failure_logged = True
+                logger.warning("D-Bus status lookup failed, falling back to systemctl", exc_info=True)
+            else:
+                logger.debug("D-Bus status lookup failed, falling back to systemctl")
+
+    result = _run([SYSTEMCTL, "show", "-p", ",".join(SYSTEMD_STATUS_PROPERTIES), *services])
+    if result["code"] != 0:
+        logger.warning(
+            "systemctl show failed",
+            extra={"extra_fields": {"services": services, "code": result["code"]}}
+        )
+        return {service: {"error": result["stderr"]} for service in services}
+
+    # One block of Key=Value lines per unit, in argument order, separated by blank lines
+    blocks = [block for block in result["stdout"].split("\n\n") if block.strip()]
+    statuses = {}
+    for service, block in zip(services, blocks):
+        fields = dict(line.split("=", 1) for line in block.splitlines() if "=" in line)
+        if "MainPID" in fields:
+            fields["MainPID"] = int(fields["MainPID"])
+        statuses[service] = fields
+    return statuses
+
+
+def batch_status(services: list[str]) -> dict:
+    """
+    Fetch systemd state for several services with a single query.
+    Returns a dict keyed by service name with LoadState, ActiveState, SubState and MainPID.
+    Results are reused for STATUS_CACHE_TTL seconds; only uncached services are queried.
+    """
+    for service in services:
+        require_service(service)
+
+    with _cache_lock:
+        statuses = {service: _status_cache[service] for service in services if service in _status_cache}
+        generations = {service: _service_generation.get(service, 0) for service in services}
+    missing = [service for service in services if service not in statuses]
+    if missing:
+        fresh = _query_status(missing)
+        with _cache_lock:
+            for service, status in fresh.items():
+                if "error" not in status and _service_generation.get(service, 0) == generations[service]:
+                    _status_cache[service] = status
+        statuses.update(fresh)
+    return {service: statuses[service] for service in services if service in statuses}
+
+
+def _invalidate_service_cache(service: str) -> None:
+    """Forget cached status and logs for a service after it was restarted or stopped"""
+    with _cache_lock:
+        _service_generation[service] = _service_generation.get(service, 0) + 1
+        _status_cache.pop(service, None)
+        for key in [key for key in _logs_cache.keys() if key[0] == service]:
+            _logs_cache.pop(key, None)
+
+
+def _resolve_artifact(application_name: str):
+    """
+    Find the artifact file for an application and stat it.
+    Returns (path, stat_result), with stat_result None if a fixed artifact path does not exist.
+    Wildcard lookups are cached for ARTIFACT_CACHE_TTL seconds while the artifact directory is unchanged.
+    """
+    meta = _APP_META[application_name]
+    artifact_pattern = meta.repo_path / meta.config.artifact_path
+
+    if '*' not in str(artifact_pattern):
+        # One os.stat answers both "does it exist" and "how big is it"
+        try:
+            return artifact_pattern, os.stat(artifact_pattern)
+        except FileNotFoundError:
+            return artifact_pattern, None
+
+    try:
+        dir_mtime = os.stat(artifact_pattern.parent).st_mtime_ns
+    except FileNotFoundError:
+        raise ValueError("No artifact found matching pattern")
+
+    now = time.monotonic()
+    cached = _artifact_cache.get(application_name)
+    if cached and cached[1] == dir_mtime and now - cached[0] < ARTIFACT_CACHE_TTL:
+        # Rewriting the jar in place leaves the directory mtime alone, so check the file itself too
+        try:
+            artifact_stat = os.stat(cached[2])
+        except FileNotFoundError:
+            artifact_stat = None
+        if (
+            artifact_stat is not None
+            and artifact_stat.st_mtime_ns == cached[3].st_mtime_ns
+            and artifact_stat.st_size == cached[3].st_size
+        ):
+            return cached[2], artifact_stat
+
+    # Single pass over the directory keeping the newest match
+    best = None
+    best_stat = None
+    matches = 0
+    with os.scandir(artifact_pattern.parent) as entries:
+        for entry in entries:
+            if not fnmatch.fnmatch(entry.name, artifact_pattern.name):
+                continue
+            entry_stat = entry.stat()
+            matches += 1
+            if best_stat is None or entry_stat.st_mtime > best_stat.st_mtime:
+                best, best_stat = entry, entry_stat
+    if best is None:
+        raise ValueError("No artifact found matching pattern")
+    artifact, artifact_stat = Path(best.path), best_stat
+    if matches > 1:
+        logger.info("Multiple artifacts found, using the newest: %s", artifact)
+
+    _artifact_cache[application_name] = (now, dir_mtime, artifact, artifact_stat)
+    return artifact, artifact_stat
 
 
 def get_artifact_file(application_name: str):
     """Get the artifact file for an application"""
-    app_cfg = APPLICATIONS[application_name]
-    artifact_pattern = BASE_REPO_DIR / application_name / app_cfg["artifact_path"]
-
-    if '*' in str(artifact_pattern):
-        artifacts = list(artifact_pattern.parent.glob(artifact_pattern.name))
-        if not artifacts:
-            raise ValueError("No artifact found matching pattern")
-        # Sort by modification time descending (newest first)
-        artifacts.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-        artifact = artifacts[0]
-        if len(artifacts) > 1:
-            logger.info(f"Multiple artifacts found, using the newest: {artifact}")
-    else:
-        artifact = artifact_pattern
-
-    return artifact
+    return _resolve_artifact(application_name)[0]
+
+
+def _copy_artifact(source: Path, target: Path) -> None:
+    """Copy an artifact in-kernel with sendfile(2) and preserve metadata like shutil.copy2"""
+    if not hasattr(os, "sendfile"):
+        shutil.copy2(source, target)
+        return
+
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        size = os.fstat(src.fileno()).st_size
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+    shutil.copystat(source, target)
+
+
+def _stage_artifact(source: Path, staged: Path) -> None:
+    """
+    Place a private copy of the artifact at `staged`.
+    Never a hardlink: the deployed file must not share an inode with the build workspace,
+    and renaming a link over another link to the same inode is a no-op.
+    """
+    # Unlink first so a stale staged file that is a link to the live artifact is never written through
+    staged.unlink(missing_ok=True)
+    _copy_artifact(source, staged)
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    """Hardlink source to target, copying instead where the filesystem has no hardlinks"""
+    target.unlink(missing_ok=True)
+    try:
+        os.link(source, target)
+    except OSError:
+        _copy_artifact(source, target)
 
 
 # ========================
 # API TOOLS (Standalone)
 # ========================
 
+def _serialize(value):
+    """Convert configuration values to JSON-friendly types (Path -> str), recursively"""
+    if isinstance(value, dict):
+        return {key: _serialize(item) for key, item in value.items()}
+    if isinstance(value, Path):
+        return str(value)
+    return value
+
+
+# Deployment configuration, built and serialized once; APPLICATIONS does not change at runtime
+_APP_DEPLOYMENT_CONFIGURATION = {
+    "applications": _serialize({name: asdict(spec) for name, spec in APPLICATIONS.items()})
+}
+_APP_DEPLOYMENT_CONFIGURATION_JSON = orjson.dumps(_APP_DEPLOYMENT_CONFIGURATION)
+
+
+def get_app_deployment_configuration_json() -> bytes:
+    """Get application deployment configuration pre-serialized as JSON bytes"""
+    return _APP_DEPLOYMENT_CONFIGURATION_JSON
+
+
 def get_app_deployment_configuration() -> dict:
     """Get application deployment configuration"""
     logger.debug("Retrieving deployment configuration")
-    return {"applications": APPLICATIONS}
+    # Callers get their own copy so they can't alter the cached configuration. AppSpec fields are
+    # scalars, so copying the per-application dicts copies everything mutable.
+    return {
+        "applications": {
+            name: dict(settings)
+            for name, settings in _APP_DEPLOYMENT_CONFIGURATION["applications"].items()
+        }
+    }
 
 
 def checkout_repository(application_name: str) -> dict:
@@ -83,42 +494,89 @@ def checkout_repository(application_name: str) -> dict:
 
     require_application(application_name)
 
-    app_cfg = APPLICATIONS[application_name]
-    repo_path = BASE_REPO_DIR / application_name
+    app_cfg, _, repo_path = _APP_META[application_name]
     repo_path.parent.mkdir(parents=True, exist_ok=True)
 
+    depth = ["--depth=1"] if app_cfg.shallow_clone else []
     if not repo_path.exists():
-        result = _run(["git", "clone", "-b", app_cfg["branch"], app_cfg["git_url"], str(repo_path)])
+        result = _run(["git", "clone", *depth, "--single-branch", "-b", app_cfg.branch, app_cfg.git_url, str(repo_path)])
     else:
-        _run(["git", "fetch"], cwd=repo_path)
-        _run(["git", "checkout", app_cfg["branch"]], cwd=repo_path)
-        result = _run(["git", "pull"], cwd=repo_path)
+        # Move straight to the remote tip; nothing is built from local commits, so no merge is needed.
+        # Both git steps run from one spawned shell; the branch is passed as "$1", never interpolated.
+        update_script = f'git fetch {" ".join(depth)} origin "$1" && git reset --hard FETCH_HEAD'
+        result = _run(["sh", "-c", update_script, "sh", app_cfg.branch], cwd=repo_path)
 
     return {"success": result["code"] == 0, "details": result}
 
 
-def build_application(application_name: str) -> dict:
-    """Build application using predefined build system"""
+def build_application(application_name: str, on_line=None) -> dict:
+    """
+    Build application using predefined build system.
+    If on_line is given, it is called with each output line while the build runs.
+    """
     logger.info(
         "Building application",
         extra={"extra_fields": {"application_name": application_name}}
     )
 
     require_application(application_name)
-    if application_name not in APPLICATIONS:
-        raise ValueError("Repository not allowed")
 
-    app_cfg = APPLICATIONS[application_name]
-    repo_path = BASE_REPO_DIR / application_name
-    cmd = BUILD_COMMANDS[app_cfg["build_type"]]
-
-    if not cmd:
+    app_cfg, _, repo_path = _APP_META[application_name]
+    try:
+        cmd = BUILD_COMMANDS[app_cfg.build_type]
+    except KeyError:
         raise ValueError("Unsupported build type")
 
-    result = _run(cmd, cwd=repo_path)
+    if on_line is None:
+        result = _run(cmd, cwd=repo_path)
+    else:
+        result = _run_streaming(cmd, cwd=repo_path, on_line=on_line)
     return {"success": result["code"] == 0, "logs": result}
 
 
+async def stream_build_application(application_name: str):
+    """
+    Build application and yield {"line": ...} items as output is produced,
+    followed by a final {"result": ...} (or {"error": ...}) item.
+    The build keeps running to completion if the consumer stops early.
+    """
+    loop = asyncio.get_running_loop()
+    lines = asyncio.Queue()
+    consumer_gone = threading.Event()
+
+    def on_line(line):
+        # Nothing reads the queue once the consumer has gone; don't let it grow for the rest of the build
+        if not consumer_gone.is_set():
+            loop.call_soon_threadsafe(lines.put_nowait, line)
+
+    def log_abandoned_build(future):
+        """Retrieve the outcome of a build nobody is waiting for, logging it if it failed"""
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Streamed build failed after its consumer went away", exc_info=future.exception())
+
+    build = loop.run_in_executor(None, build_application, application_name, on_line)
+    # Scheduled after every queued line, so it marks the end of output
+    build.add_done_callback(lambda _: lines.put_nowait(None))
+
+    awaited = False
+    try:
+        while (line := await lines.get()) is not None:
+            yield {"line": line.rstrip("\n")}
+        try:
+            result = await build
+        except Exception as e:
+            logger.error("Error during streamed build", exc_info=True)
+            awaited = True
+            yield {"error": str(e)}
+        else:
+            awaited = True
+            yield {"result": result}
+    finally:
+        consumer_gone.set()
+        if not awaited:
+            build.add_done_callback(log_abandoned_build)
+
+
 def verify_artifact(application_name: str) -> dict:
     """Verify build artifact exists and is non-empty"""
     logger.info(
@@ -129,14 +587,17 @@ def verify_artifact(application_name: str) -> dict:
     require_application(application_name)
 
     try:
-        artifact = get_artifact_file(application_name)
+        artifact, artifact_stat = _resolve_artifact(application_name)
     except ValueError as e:
         return {"success": False, "error": str(e)}
 
-    if artifact.stat().st_size == 0:
+    if artifact_stat is None:
+        return {"success": False, "error": "Artifact not found"}
+
+    if artifact_stat.st_size == 0:
         return {"success": False, "error": "Artifact size is zero"}
 
-    return {"success": True, "artifact": str(artifact), "size_bytes": artifact.stat().st_size}
+    return {"success": True, "artifact": str(artifact), "size_bytes": artifact_stat.st_size}
 
 
 def deploy_artifact(application_name: str) -> dict:
@@ -148,7 +609,7 @@ def deploy_artifact(application_name: str) -> dict:
     try:
         require_application(application_name)
 
-        app_cfg = APPLICATIONS[application_name]
+        app_cfg = _APP_META[application_name].config
         try:
             artifact = get_artifact_file(application_name)
         except ValueError as e:
@@ -158,53 +619,60 @@ def deploy_artifact(application_name: str) -> dict:
             )
             raise ValueError("Artifact not found, build first")
 
-        deploy_dir = app_cfg['deploy_path']
+        deploy_dir = app_cfg.deploy_path
         deploy_dir.mkdir(parents=True, exist_ok=True)
 
         target = deploy_dir / artifact.name
+        target_str = str(target)
         backup = deploy_dir / f"{artifact.name}.bak"
 
-        if target.exists():
+        backup_created = target.exists()
+        if backup_created:
             logger.info(
                 "Creating backup of existing deployment",
                 extra={"extra_fields": {"application_name": application_name, "backup": str(backup)}}
             )
-            shutil.move(target, backup)
+            # Hardlink the live file as the backup so target never disappears
+            backup_tmp = deploy_dir / f"{artifact.name}.bak.tmp"
+            _link_or_copy(target, backup_tmp)
+            os.replace(backup_tmp, backup)
+            # rename() leaves both names in place when they already link to one inode
+            backup_tmp.unlink(missing_ok=True)
 
         logger.info(
-            "Copying artifact to deployment directory",
+            "Staging artifact in deployment directory",
             extra={"extra_fields": {
                 "application_name": application_name,
                 "source": str(artifact),
-                "target": str(target)
+                "target": target_str
             }}
         )
-        shutil.copy2(artifact, target)
+        staged = deploy_dir / f"{artifact.name}.tmp"
+        _stage_artifact(artifact, staged)
+        # Atomic swap: the service sees either the old or the new file, never a partial one
+        os.replace(staged, target)
 
         # Manage symlink if configured
-        if "symlink" in app_cfg:
-            symlink_path = deploy_dir / app_cfg["symlink"]
-            if symlink_path.exists() or symlink_path.is_symlink():
-                symlink_path.unlink()
-                logger.info(
-                    "Removed old symlink",
-                    extra={"extra_fields": {"application_name": application_name, "symlink": str(symlink_path)}}
-                )
-            symlink_path.symlink_to(target)
+        if app_cfg.symlink:
+            symlink_path = deploy_dir / app_cfg.symlink
+            new_symlink = deploy_dir / f"{app_cfg.symlink}.new"
+            new_symlink.unlink(missing_ok=True)
+            new_symlink.symlink_to(target)
+            os.replace(new_symlink, symlink_path)
             logger.info(
-                "Created symlink",
+                "Updated symlink",
                 extra={"extra_fields": {
                     "application_name": application_name,
                     "symlink": str(symlink_path),
-                    "points_to": str(target)
+                    "points_to": target_str
                 }}
             )
 
         logger.info(
             "Artifact deployed successfully",
-            extra={"extra_fields": {"application_name": application_name, "deployed_to": str(target)}}
+            extra={"extra_fields": {"application_name": application_name, "deployed_to": target_str}}
         )
-        return {"success": True, "deployed_to": str(target), "backup": str(backup) if backup.exists() else None}
+        return {"success": True, "deployed_to": target_str, "backup": str(backup) if backup_created else None}
     except Exception:
         logger.error("Error during artifact deployment", exc_info=True)
         raise
@@ -219,10 +687,10 @@ def restart_application(application_name: str) -> dict:
 
     try:
         require_application(application_name)
-        app_cfg = APPLICATIONS[application_name]
-        service_name = app_cfg["service_name"]
+        service_name = _APP_META[application_name].service_name
         require_service(service_name)
-        result = _run(["systemctl", "restart", service_name])
+        result = _run(list(_RESTART_ARGV[service_name]))
+        _invalidate_service_cache(service_name)
 
         success = result["code"] == 0
         if success:
@@ -249,10 +717,10 @@ def stop_application(application_name: str) -> dict:
 
     try:
         require_application(application_name)
-        app_cfg = APPLICATIONS[application_name]
-        service_name = app_cfg["service_name"]
+        service_name = _APP_META[application_name].service_name
         require_service(service_name)
-        result = _run(["systemctl", "stop", service_name])
+        result = _run(list(_STOP_ARGV[service_name]))
+        _invalidate_service_cache(service_name)
 
         success = result["code"] == 0
         if success:
@@ -279,24 +747,43 @@ def get_application_status(application_name: str) -> dict:
 
     try:
         require_application(application_name)
-        app_cfg = APPLICATIONS[application_name]
-        service_name = app_cfg["service_name"]
-        require_service(service_name)
+        service_name = _APP_META[application_name].service_name
         logger.debug(
             "Fetching application status",
             extra={"extra_fields": {"service_name": service_name}}
         )
-        result = _run(["systemctl", "status", service_name, "--no-pager"])
+        status = batch_status([service_name])[service_name]
         logger.debug(
             "Application status fetched",
             extra={"extra_fields": {"service": service_name}}
         )
-        return {"service": service_name, "status": result}
+        return {"service": service_name, "status": status}
     except Exception:
         logger.error("Error fetching service status", exc_info=True)
         raise
 
 
+def get_application_statuses(application_names: list[str]) -> dict:
+    """Get systemd service status for several applications with a single systemctl call"""
+    logger.info(
+        "Getting application statuses",
+        extra={"extra_fields": {"application_names": application_names}}
+    )
+
+    try:
+        for application_name in application_names:
+            require_application(application_name)
+        service_names = {name: _APP_META[name].service_name for name in application_names}
+        statuses = batch_status(list(service_names.values()))
+        return {
+            name: {"service": service_name, "status": statuses[service_name]}
+            for name, service_name in service_names.items()
+        }
+    except Exception:
+        logger.error("Error fetching service statuses", exc_info=True)
+        raise
+
+
 def get_recent_logs(application_name: str, lines: int = 100) -> dict:
     """Fetch recent logs safely"""
     logger.info(
@@ -306,14 +793,33 @@ def get_recent_logs(application_name: str, lines: int = 100) -> dict:
 
     try:
         require_application(application_name)
-        app_cfg = APPLICATIONS[application_name]
-        service_name = app_cfg["service_name"]
+        service_name = _APP_META[application_name].service_name
         require_service(service_name)
         logger.debug(
             "Fetching recent logs",
             extra={"extra_fields": {"service_name": service_name, "lines": lines}}
         )
-        result = _run(["journalctl", "-u", service_name, "-n", str(lines), "--no-pager"])
+        with _cache_lock:
+            result = _logs_cache.get((service_name, lines))
+            generation = _service_generation.get(service_name, 0)
+        if result is not None:
+            logger.debug(
+                "Recent logs served from cache",
+                extra={"extra_fields": {"service": service_name}}
+            )
+            return {"service": service_name, "logs": result}
+
+        if journal is not None:
+            try:
+                result = _read_journal_tail(service_name, lines)
+            except Exception:
+                logger.warning("Journal reader failed, falling back to journalctl", exc_info=True)
+        if result is None:
+            result = _run([JOURNALCTL, "-u", service_name, "-n", str(lines), "--no-pager"])
+        if result["code"] == 0:
+            with _cache_lock:
+                if _service_generation.get(service_name, 0) == generation:
+                    _logs_cache[(service_name, lines)] = result
         logger.debug(
             "Recent logs fetched",
             extra={"extra_fields": {"service": service_name}}
@@ -323,11 +829,56 @@ def get_recent_logs(application_name: str, lines: int = 100) -> dict:
         logger.error("Error fetching service logs", exc_info=True)
         raise
 
+async def stream_recent_logs(application_name: str, lines: int = 100, follow: bool = False):
+    """
+    Stream recent logs as journal JSON lines (one entry per line) while journalctl produces them.
+    If journalctl fails, a final {"error": {"code": ..., "stderr": ...}} line ends the stream.
+    """
+    logger.info(
+        "Streaming recent logs",
+        extra={"extra_fields": {"application_name": application_name, "lines": lines, "follow": follow}}
+    )
+
+    require_application(application_name)
+    service_name = _APP_META[application_name].service_name
+    require_service(service_name)
+
+    cmd = [JOURNALCTL, "-u", service_name, "-n", str(lines), "--no-pager", "--output=json"]
+    if follow:
+        cmd.append("-f")
+
+    # stderr goes to a temp file, as in _run, so it can be reported without a second pipe to drain
+    with tempfile.TemporaryFile() as stderr:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=stderr, limit=LOG_STREAM_LINE_LIMIT
+        )
+        try:
+            async for line in proc.stdout:
+                yield line
+            if await proc.wait() != 0:
+                error = {"code": proc.returncode, "stderr": _read_tail(stderr)}
+                logger.warning(
+                    "journalctl log stream failed",
+                    extra={"extra_fields": {"service": service_name, **error}}
+                )
+                # End the stream with an error item, as stream_build_application does
+                yield orjson.dumps({"error": error}) + b"\n"
+        finally:
+            # Client went away (or follow mode was cancelled): don't leave journalctl running
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            logger.debug(
+                "Log stream closed",
+                extra={"extra_fields": {"service": service_name, "code": proc.returncode}}
+            )
+
+
 def get_all_services_status_on_server() -> dict:
     """List all systemd services on the server"""
     logger.info("Listing running services")
     try:
-        result = _run(["systemctl", "list-units", "--type=service", "--no-pager"])
+        result = _run([SYSTEMCTL, "list-units", "--type=service", "--no-pager"])
         logger.debug("Running services fetched")
         return {"running services": result["stdout"]}
     except Exception:
@@ -338,17 +889,12 @@ def get_server_health_summary() -> dict:
     """Fetch server health summary including CPU, memory, disk, load average"""
     logger.info("Fetching server health summary")
     try:
-        load_result = _run(["uptime"])
-        mem_result = _run(["free", "-h"])
-        disk_result = _run(["df", "-h"])
-        cpu_result = _run(["vmstat", "1", "2"])
-
-        return {
-            "load_average": load_result["stdout"],
-            "memory": mem_result["stdout"],
-            "disk": disk_result["stdout"],
-            "cpu": cpu_result["stdout"]
+        # The commands are independent; run them together so the total is bounded by vmstat's ~1s sample
+        futures = {
+            key: _HEALTH_EXECUTOR.submit(_run, cmd)
+            for key, cmd in HEALTH_SUMMARY_COMMANDS.items()
         }
+        return {key: future.result()["stdout"] for key, future in futures.items()}
     except Exception:
         logger.error("Error fetching server health summary", exc_info=True)
         raise